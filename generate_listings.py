@@ -6,30 +6,65 @@ Izu Coastal Radar - Generator v16 (Failsafe & Context Trust)
 """
 
 from __future__ import annotations
+import codecs
 import datetime as dt
 import hashlib
 import json
+import logging
 import os
 import random
 import re
+import sys
 import threading
 import time
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor
-from urllib.parse import urljoin, parse_qs, urlparse
+from functools import lru_cache
+from urllib.parse import urljoin, parse_qs, urlparse, urlsplit, urlunsplit
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
 import urllib3
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # optional: much faster JSON load/dump, same output
+except ImportError:
+    orjson = None
+
+try:
+    import lxml  # optional: C tree builder for BeautifulSoup
+except ImportError:
+    lxml = None
+
+try:
+    import re2  # optional: linear-time matching for the .* proximity patterns
+except ImportError:
+    re2 = None
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Run progress goes through logging: per-detail-page lines are DEBUG, so the
+# default INFO level skips formatting and writing them (LOG_LEVEL=DEBUG shows them).
+log = logging.getLogger("izu_radar")
+
 # --- CONFIG ---
 OUT_LISTINGS = "listings.json"
 OUT_BUILDINFO = "buildInfo.json"
 GEOCACHE_FILE = "geocache.json"
 
+# BeautifulSoup tree builder: libxml2-backed lxml is several times faster than
+# the pure-Python html.parser, which is only used when lxml isn't installed.
+HTML_PARSER = "lxml" if lxml else "html.parser"
+
 # We only want these areas
 TARGET_CITIES_JP = ["下田", "河津", "東伊豆", "南伊豆", "賀茂郡"]
 
+# Per-city matchers that tolerate whitespace between characters (下 田), so
+# normalize_city() needn't strip whitespace from the whole page first.
+_CITY_RES = [(c, re.compile(r"\s*".join(map(re.escape, c))))
+             for c in TARGET_CITIES_JP]
+
 CITY_EN_MAP = {
     "下田": "Shimoda",
     "河津": "Kawazu",
@@ -59,6 +94,35 @@ MEDIUM_SEA_KEYWORDS = [
 # For proximity scoring - used with "海" mention
 PROXIMITY_KEYWORDS = ["徒歩", "歩", "近", "分", "m", "メートル"]
 
+# LOW CONFIDENCE: walking distance to the sea (score 2). Require explicit
+# distance/time measurements ("海まで徒歩5分", "海から100m") to avoid false
+# positives.
+PROXIMITY_PATTERNS = (
+    r"海まで徒歩[0-9０-９]",                # 海まで徒歩5分
+    r"海まで.*[0-9０-９]+.*分",             # 海まで約5分
+    r"海まで.*[0-9０-９]+.*[mｍメートル]",  # 海まで100m
+    r"海から[0-9０-９]+.*[mｍメートル]",    # 海から100m
+    r"徒歩[0-9０-９]+.*分.*海",             # 徒歩5分で海
+    r"ビーチまで.*[0-9０-９]+",             # ビーチまで5分
+    r"海.*徒歩圏",                          # 海が徒歩圏内
+)
+# All proximity patterns as one compiled alternation: a single regex call per
+# page instead of one per pattern. The .* wildcards backtrack quadratically in
+# the stdlib engine on long pages with many 海, so RE2 is used when installed.
+_PROXIMITY_RE = (re2 or re).compile("|".join(f"(?:{p})" for p in PROXIMITY_PATTERNS))
+
+# Explicit "no sea view" statements override every other sea signal
+NO_SEA_PHRASES = ("海は見えません", "海眺望なし", "海見えず")
+_NO_SEA_RE = re.compile("|".join(map(re.escape, NO_SEA_PHRASES)))
+
+# HIGH and MEDIUM keywords merged into one alternation so a page is scanned
+# once instead of once per keyword. Longest first, so e.g. オーシャンビュー
+# (HIGH) wins over its prefix オーシャン (MEDIUM) at the same position.
+_SEA_KEYWORD_TIER = {k: 3 for k in MEDIUM_SEA_KEYWORDS}
+_SEA_KEYWORD_TIER.update({k: 4 for k in HIGH_SEA_KEYWORDS})
+_SEA_KEYWORD_RE = re.compile("|".join(
+    re.escape(k) for k in sorted(_SEA_KEYWORD_TIER, key=len, reverse=True)))
+
 # Keywords to Identify House vs Land
 HOUSE_KEYWORDS = ["戸建", "家", "建物", "LDK", "House", "Room", "築"]
 LAND_KEYWORDS = ["売地", "土地", "Land", "建築条件"]
@@ -68,6 +132,48 @@ CONDO_KEYWORDS = ["マンション", "mansion", "condo"]
 
 # Status Keywords (Exclude Sold)
 CONTRACTED_KEYWORDS = ["成約", "商談中", "予約", "Sold", "Contracted", "Reserved", "済"]
+_CONTRACTED_RE = re.compile("|".join(map(re.escape, CONTRACTED_KEYWORDS)))
+
+# SUUMO search-result page structure
+_NEXT_PAGE_RE = re.compile(r"次へ|次のページ|›|>")
+_NC_HREF_RE = re.compile(r"/nc_\d+")
+_CARD_CLASS_RE = re.compile(r"cassette|item|property", re.I)
+_THUMB_ATTRS = ("src", "data-src", "data-lazy", "data-original")
+
+# Izu Taiyo result pages: property ids in onclick handlers, hrefs and raw HTML
+_ONCLICK_HPNO_RES = (
+    re.compile(r"d\.php\?hpno=(\w+)"),       # d.php?hpno=XXX
+    re.compile(r"['\"]hpno=(\w+)"),           # 'hpno=XXX' (without d.php)
+    re.compile(r"hpno\s*=\s*['\"](\w+)"),     # hpno = 'XXX'
+)
+_ONCLICK_HPBUNNO_RES = (
+    re.compile(r"d\.php\?hpbunno=([^'\"&]+)"),
+    re.compile(r"['\"]hpbunno=([^'\"&]+)"),
+    re.compile(r"hpbunno\s*=\s*['\"]([^'\"&]+)"),
+)
+_HREF_HPNO_RE = re.compile(r"[?&](hpno=\w+)")
+_HREF_HPBUNNO_RE = re.compile(r"[?&](hpbunno=[^'\"&#]+)")
+_RAW_HPNO_RE = re.compile(r'd\.php\?hpno=(\w+)')
+_RAW_HPBUNNO_RE = re.compile(r'd\.php\?hpbunno=([^\'\"&\s]+)')
+_IZUTAIYO_IMG_RE = re.compile(r'bb/\w+/\w+[a-z]\.jpg')
+
+# Izu Mirai detail links: /bkndetail/<id>/ with an optional /roomN/ suffix
+_BKNDETAIL_RE = re.compile(r'/bkndetail/\d+/')
+_ROOM_SUFFIX_RE = re.compile(r'/room\d+/?$')
+
+# Listing pages that are only scanned for detail links are parsed with this
+# strainer, so the tree holds just the <a href> tags.
+LINKS_ONLY = SoupStrainer("a", href=True)
+
+# Page-chrome elements some detail parsers drop (see fetch_detail's drop=)
+_CHROME_TAG_RE = re.compile(r"<(footer|nav|header)\b", re.I)
+
+# Detail pages are fetched on a small thread pool per source; each host still
+# sees at most HOST_MAX_IN_FLIGHT concurrent requests (see host_slot()), and
+# request starts to one host are spaced by a random HOST_INTERVAL (host_pace()).
+DETAIL_WORKERS = 4
+HOST_MAX_IN_FLIGHT = 2
+HOST_INTERVAL = (0.5, 1.5)  # seconds
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -90,6 +196,34 @@ def inc_stat(key, n=1):
     with STATS_LOCK:
         STATS[key] += n
 
+# --- POLITENESS ---
+_HOST_SLOTS = {}
+_HOST_SLOTS_LOCK = threading.Lock()
+
+def host_slot(url):
+    """Semaphore capping concurrent requests to url's host across all scrapers."""
+    host = urlparse(url).netloc
+    with _HOST_SLOTS_LOCK:
+        if host not in _HOST_SLOTS:
+            _HOST_SLOTS[host] = threading.BoundedSemaphore(HOST_MAX_IN_FLIGHT)
+        return _HOST_SLOTS[host]
+
+_HOST_NEXT = {}  # host -> earliest time.monotonic() for its next request
+
+def host_pace(url):
+    """Wait until url's host is due another request, then book the next slot.
+
+    Only requests to the same host wait on each other, so one source's
+    politeness delay never holds up a fetch to a different site.
+    """
+    host = urlparse(url).netloc
+    with _HOST_SLOTS_LOCK:
+        now = time.monotonic()
+        start = max(now, _HOST_NEXT.get(host, now))
+        _HOST_NEXT[host] = start + random.uniform(*HOST_INTERVAL)
+    if start > now:
+        time.sleep(start - now)
+
 # --- FOREX RATE ---
 
 def get_usd_jpy_rate():
@@ -104,13 +238,13 @@ def get_usd_jpy_rate():
             data = response.json()
             rate = data.get("rates", {}).get("JPY")
             if rate:
-                print(f"  [FOREX] Fetched USD/JPY rate: ¥{rate:.2f}/$1")
+                log.info(f"  [FOREX] Fetched USD/JPY rate: ¥{rate:.2f}/$1")
                 return round(rate, 2)
     except Exception as e:
-        print(f"  [FOREX] Failed to fetch rate: {e}")
+        log.warning(f"  [FOREX] Failed to fetch rate: {e}")
 
     # Fallback
-    print(f"  [FOREX] Using fallback rate: ¥155/$1")
+    log.info(f"  [FOREX] Using fallback rate: ¥155/$1")
     return 155
 
 # --- HELPERS ---
@@ -119,41 +253,186 @@ def stable_id(prefix, url):
     """Deterministic ID from URL — survives across Python runs (unlike hash())."""
     return f"{prefix}-{hashlib.md5(url.encode()).hexdigest()[:16]}"
 
-def sleep_jitter():
-    time.sleep(random.uniform(0.5, 1.5))
+def canonical_url(url):
+    """url without its #fragment and with a lower-case host, so a detail page
+    linked two ways is collected (and fetched) once."""
+    p = urlsplit(url)
+    return urlunsplit((p.scheme, p.netloc.lower(), p.path, p.query, ""))
+
+def load_json(path):
+    """Read a JSON file, via orjson when it is installed."""
+    if orjson:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def dump_json(obj, path, indent=True):
+    """Write obj as UTF-8 JSON (2-space indent unless indent=False).
+
+    orjson only writes the indented form, which matches json.dump's byte for
+    byte; it has no ", "/": " separators, so compact output stays on json.
+    The data goes to a temporary file that is then renamed over path, so an
+    interrupted run never leaves a truncated file for the site to load.
+    """
+    if indent and orjson:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, ensure_ascii=False,
+                          indent=2 if indent else None).encode("utf-8")
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+def make_session():
+    """requests.Session that keeps connections alive and retries transient
+    5xx and 429.
+
+    raise_on_status=False hands the final response back to the caller once
+    retries run out, so status-code handling in fetch() is unchanged.
+    read=0 limits retries to connection errors and the listed statuses: a
+    read timeout is not retried, so a hung host costs one 15 s timeout per
+    page rather than four while the worker holds its host_slot.
+    Retry-After is ignored in favour of the short exponential backoff: an
+    unbounded server-chosen wait would stall the worker in the same way.
+    """
+    session = requests.Session()
+    retry = Retry(total=3, read=0, backoff_factor=0.5,
+                  status_forcelist=(429, 502, 503, 504),
+                  respect_retry_after_header=False, raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=DETAIL_WORKERS,
+                          max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(HEADERS)
+    return session
+
+_HEADER_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.I)
+_META_CHARSET_RE = re.compile(rb"charset=[\"']?([\w.:-]+)", re.I)
+# Declared labels decoded with their superset codec, as browsers do
+_CHARSET_ALIASES = {"shift_jis": "cp932", "shift-jis": "cp932", "sjis": "cp932",
+                    "x-sjis": "cp932", "windows-31j": "cp932"}
+
+def response_text(r):
+    """Decoded body of response r.
+
+    Uses the charset from the Content-Type header, else from a <meta> tag in
+    the first 2 KB. When neither names a usable Japanese-capable codec, a
+    body that decodes cleanly as UTF-8 is taken as UTF-8 (Shift_JIS/EUC-JP
+    text practically never does); only the rest falls back to
+    r.apparent_encoding, which runs charset detection over the whole body.
+    """
+    declared = []
+    m = _HEADER_CHARSET_RE.search(r.headers.get("Content-Type", ""))
+    if m:
+        declared.append(m.group(1))
+    m = _META_CHARSET_RE.search(r.content[:2048])
+    if m:
+        declared.append(m.group(1).decode("ascii"))
+    for label in declared:
+        label = _CHARSET_ALIASES.get(label.lower(), label.lower())
+        try:
+            name = codecs.lookup(label).name
+        except LookupError:
+            continue
+        # A Latin-1/ASCII label on these sites means "not really declared"
+        if name not in ("latin-1", "iso8859-1", "ascii", "cp1252"):
+            r.encoding = label
+            return r.text
+    try:
+        text = r.content.decode("utf-8")
+    except UnicodeDecodeError:
+        r.encoding = r.apparent_encoding
+        return r.text
+    r.encoding = "utf-8"
+    return text
+
+def make_soup(html, parse_only=None):
+    """Parse HTML with HTML_PARSER, optionally keeping only parse_only matches."""
+    return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only)
+
+# "tag", ".class", "#id" and "tag.class" / "tag#id" selectors
+_SIMPLE_SELECTOR_RE = re.compile(r"([a-z][a-z0-9]*)?(?:\.([\w-]+)|#([\w-]+))?")
+
+def select_first(soup, selector):
+    """soup.select_one(selector), answered with find() for simple selectors.
+
+    soupsieve already caches the compiled selector, but matching it still
+    runs in Python for every node; find() is several times faster on a full
+    page. Anything beyond a tag/class/id (descendants, attributes) goes to
+    select_one().
+    """
+    m = _SIMPLE_SELECTOR_RE.fullmatch(selector)
+    if not m or not any(m.groups()):
+        return soup.select_one(selector)
+    name, cls, id_ = m.groups()
+    if cls:
+        return soup.find(name, class_=cls)
+    if id_:
+        return soup.find(name, id=id_)
+    return soup.find(name)
 
 def clean_text(s):
-    return re.sub(r"\s+", " ", s or "").strip()
+    # str.split() collapses the same whitespace set as \s+ and strips the ends,
+    # without going through the regex engine.
+    return " ".join(s.split()) if s else ""
+
+def clean_text_head(s, n):
+    """clean_text(s)[:n], cleaning only as much of s as that needs."""
+    k = n
+    while k < len(s):
+        words = s[:k].split()
+        # The last word may be cut off at k; the ones before it are complete
+        head = " ".join(words[:-1])
+        if len(head) >= n:
+            return head[:n]
+        k *= 2
+    return clean_text(s)[:n]
+
+_NON_DIGIT_RE = re.compile(r"[^\d]")
 
 def safe_int(s):
-    try: return int(re.sub(r"[^\d]", "", s))
+    try: return int(_NON_DIGIT_RE.sub("", s))
     except: return 0
 
+# normalize_city() memoises inputs up to this length: titles, address cells and
+# city names recur, whole pages and card text never do and would only be pinned
+_CITY_CACHE_MAX_LEN = 200
+
+def _scan_city(text):
+    for c, pattern in _CITY_RES:
+        # Plain substring test first; the regex only runs when it misses
+        if c in text or pattern.search(text):
+            # 賀茂郡 → Minami-Izu; 河津 merged into 東伊豆 per display grouping.
+            if c == "賀茂郡": return "南伊豆"
+            if c == "河津":   return "東伊豆"
+            return c
+    return None
+
+_scan_city_cached = lru_cache(maxsize=1024)(_scan_city)
+
 def normalize_city(text):
     """
     Scans text for target city names.
     Returns the first match found.
     Handles whitespace variations.
+    Short inputs are cached: the same titles, address cells and city names
+    recur across list pages, detail pages and the per-item calls.
     """
     if not text: return None
-    # Normalize whitespace for better matching
-    normalized = re.sub(r"\s+", "", text)
-    for c in TARGET_CITIES_JP:
-        # Also remove whitespace from target cities for comparison
-        c_normalized = re.sub(r"\s+", "", c)
-        if c_normalized in normalized:
-            # 賀茂郡 → Minami-Izu; 河津 merged into 東伊豆 per display grouping.
-            if c == "賀茂郡": return "南伊豆"
-            if c == "河津":   return "東伊豆"
-            return c
-    return None
+    if len(text) <= _CITY_CACHE_MAX_LEN:
+        return _scan_city_cached(text)
+    return _scan_city(text)
+
+_MAN_PRICE_RE = re.compile(r"([\d,\.]+)万")
+_YEN_PRICE_RE = re.compile(r"([\d,\.]+)円")
 
 def extract_price(text):
     if not text: return 0
-    t = clean_text(text)
 
     # Limit search to first 3000 chars to avoid concatenating page-wide digits
-    t = t[:3000]
+    t = clean_text_head(text, 3000)
 
     try:
         # Pattern: 1億 2800万
@@ -173,7 +452,9 @@ def extract_price(text):
             return 0
 
         # Pattern: 3500万円 or 868.6万円 (handle decimals for land per-unit pricing)
-        m = re.search(r"([\d,\.]+)万", t)
+        # The unit is checked with a plain substring test first: a regex that
+        # misses still tries its digit class at every position in t.
+        m = _MAN_PRICE_RE.search(t) if "万" in t else None
         if m:
             # Handle both integers and decimals (e.g., "3500" or "868.6")
             price_str = m.group(1).replace(',', '')
@@ -186,7 +467,7 @@ def extract_price(text):
                 pass
 
         # Pattern: 12000000円
-        m = re.search(r"([\d,\.]+)円", t)
+        m = _YEN_PRICE_RE.search(t) if "円" in t else None
         if m:
             price_str = m.group(1).replace(',', '')
             try:
@@ -202,9 +483,34 @@ def extract_price(text):
 def is_contracted(title, text):
     """Checks Title and sticky header text for Sold status"""
     combined = (title + " " + text[:200]).replace(" ", "")
-    for k in CONTRACTED_KEYWORDS:
-        if k in combined: return True
-    return False
+    return bool(_CONTRACTED_RE.search(combined))
+
+def score_sea_view(full_text):
+    """Tiered sea-view score for a detail page: 4 explicit view, 3 beach/ocean
+    name, 2 explicit walking distance to the sea, 0 otherwise."""
+    # Check for explicit "no sea view" statements first
+    if _NO_SEA_RE.search(full_text):
+        return 0
+    # HIGH: Explicit sea view language / MEDIUM: Famous beach or ocean names
+    best = 0
+    for m in _SEA_KEYWORD_RE.finditer(full_text):
+        best = max(best, _SEA_KEYWORD_TIER[m.group()])
+        if best == 4:
+            break
+    if best:
+        return best
+    # LOW: Walking distance to sea. Every proximity pattern needs 海 or ビーチ,
+    # so a plain substring test skips the regexes on most pages.
+    if "海" in full_text or "ビーチ" in full_text or "Beach" in full_text:
+        if _PROXIMITY_RE.search(full_text):
+            return 2
+    # Just generic "海" mention without distance/time = score 0
+    return 0
+
+def could_score_sea_view(html):
+    """Cheap pre-parse check on the raw page: False when no sea keyword, 海 or
+    ビーチ appears anywhere, i.e. score_sea_view() could not reach 2."""
+    return "海" in html or "ビーチ" in html or bool(_SEA_KEYWORD_RE.search(html))
 
 def determine_type(title, text, search_category=None):
     # When we know which search category the property came from, trust it directly.
@@ -222,19 +528,28 @@ def determine_type(title, text, search_category=None):
         return "house"
 
     # Fallback text-based detection for scrapers that don't pass a search category.
-    combined = (title + " " + text).lower()
+    # The body is only scanned for condo evidence once the title suggests one.
     title_has_condo = (any(k in title for k in CONDO_KEYWORDS) or
                        "のマンション情報" in title or "のマンション" in title)
-    body_has_condo  = any(k in text for k in ["修繕積立金", "専有面積"])
-    if title_has_condo and body_has_condo: return "condo"
+    if title_has_condo and any(k in text for k in ["修繕積立金", "専有面積"]):
+        return "condo"
     if "古家付" in title or "古家付" in text[:3000]: return "house"
     if any(k in title for k in ["売地", "土地"]): return "land"
-    if any(k in combined for k in HOUSE_KEYWORDS): return "house"
+    # HOUSE_KEYWORDS or not, everything else is treated as a house
     return "house"
 
 # Japanese era → Gregorian year offsets
 _ERA_OFFSET = {"昭和": 1925, "平成": 1988, "令和": 2018}
 
+# Year-built field values and full-text fallbacks used by extract_year_built()
+_AGE_YEARS_RE = re.compile(r'(\d+(?:\.\d+)?)年')
+_ERA_YEAR_RE = re.compile(r'(昭和|平成|令和)(\d{1,2})年')
+_WESTERN_YEAR_RE = re.compile(r'(\d{4})年')
+_AGE_TEXT_RE = re.compile(r'築年数[：:]\s*(\d+(?:\.\d+)?)年')
+_COMPLETION_ERA_RE = re.compile(r'完成時期[^\d]*?(昭和|平成|令和)(\d{1,2})年')
+_COMPLETION_YEAR_RE = re.compile(r'完成時期[^\d]*(\d{4})年')
+_BUILT_YEAR_RE = re.compile(r'築[年月\s:：]*(?:(昭和|平成|令和)(\d{1,2})年|(\d{4})年)')
+
 def extract_year_built(soup, full_text):
     """Extract construction year from a property detail page.
 
@@ -245,8 +560,7 @@ def extract_year_built(soup, full_text):
 
     Returns an integer year (e.g. 1987) or None if not found.
     """
-    import datetime
-    current_year = datetime.date.today().year
+    current_year = dt.date.today().year
 
     # Labels that indicate a year-built or completion-date field
     YEAR_LABELS   = ("築年月", "築年数", "建築年", "完成時期", "竣工年")
@@ -255,17 +569,17 @@ def extract_year_built(soup, full_text):
         """Given a field label and its raw text value, return a year int or None."""
         # Age-in-years format  e.g. "50.5年" under a 築年数 label
         if "築年数" in label:
-            m = re.search(r'(\d+(?:\.\d+)?)年', val)
+            m = _AGE_YEARS_RE.search(val)
             if m:
                 return current_year - int(float(m.group(1)))
         # Era format e.g. "昭和62年4月" / "平成12年3月" / "令和6年"
-        m = re.search(r'(昭和|平成|令和)(\d{1,2})年', val)
+        m = _ERA_YEAR_RE.search(val)
         if m:
             era_key = m.group(1)[:2]
             if era_key in _ERA_OFFSET:
                 return _ERA_OFFSET[era_key] + int(m.group(2))
         # Western year e.g. "1987年4月"
-        m = re.search(r'(\d{4})年', val)
+        m = _WESTERN_YEAR_RE.search(val)
         if m:
             y = int(m.group(1))
             if 1950 <= y <= current_year:
@@ -278,62 +592,63 @@ def extract_year_built(soup, full_text):
     EXACT_DATE_LABELS = ("築年月", "建築年", "完成時期", "竣工年")
     AGE_LABELS        = ("築年数",)
 
-    def _search_rows(label_filter):
+    def _row_pairs():
         for row in soup.find_all("tr"):
             cells = row.find_all(["th", "td"])
             if len(cells) >= 2:
-                label = cells[0].get_text(strip=True)
-                if any(k in label for k in label_filter):
-                    val = cells[1].get_text(strip=True)
-                    result = _parse_val(label, val)
-                    if result:
-                        return result
-        return None
+                yield cells[0].get_text(strip=True), cells[1]
 
-    def _search_dls(label_filter):
+    def _dl_pairs():
         for dl in soup.find_all("dl"):
-            dts = dl.find_all("dt")
-            dds = dl.find_all("dd")
-            for dt_tag, dd_tag in zip(dts, dds):
-                label = dt_tag.get_text(strip=True)
-                if any(k in label for k in label_filter):
-                    val = dd_tag.get_text(strip=True)
-                    result = _parse_val(label, val)
-                    if result:
-                        return result
-        return None
+            for dt_tag, dd_tag in zip(dl.find_all("dt"), dl.find_all("dd")):
+                yield dt_tag.get_text(strip=True), dd_tag
+
+    def _scan(pairs):
+        """One walk over (label, value tag) pairs: returns (first exact-date
+        result, None) as soon as one parses, else (None, first age result)."""
+        age_result = None
+        for label, val_tag in pairs:
+            if any(k in label for k in EXACT_DATE_LABELS):
+                result = _parse_val(label, val_tag.get_text(strip=True))
+                if result:
+                    return result, None
+            elif not age_result and any(k in label for k in AGE_LABELS):
+                age_result = _parse_val(label, val_tag.get_text(strip=True))
+        return None, age_result
 
     # ── Pass 1: exact date labels (築年月, 建築年, 完成時期, 竣工年) ────────────
-    result = _search_rows(EXACT_DATE_LABELS) or _search_dls(EXACT_DATE_LABELS)
+    # ── Pass 2: age-in-years label (築年数) — only if no exact date found ─────
+    # Both passes share one walk over the rows and one over the <dl> lists.
+    result, row_age = _scan(_row_pairs())
     if result:
         return result
-
-    # ── Pass 2: age-in-years label (築年数) — only if no exact date found ─────
-    result = _search_rows(AGE_LABELS) or _search_dls(AGE_LABELS)
+    result, dl_age = _scan(_dl_pairs())
+    if result:
+        return result
+    result = row_age or dl_age
     if result:
         return result
 
     # ── Full-text fallbacks ────────────────────────────────────────────────────
     # "築年数：50.5年"
-    m = re.search(r'築年数[：:]\s*(\d+(?:\.\d+)?)年', full_text)
+    m = _AGE_TEXT_RE.search(full_text)
     if m:
         return current_year - int(float(m.group(1)))
 
     # "完成時期（築年月）... 1987年4月" or era variant
-    m = re.search(r'完成時期[^\d]*?(昭和|平成|令和)(\d{1,2})年', full_text)
+    m = _COMPLETION_ERA_RE.search(full_text)
     if m:
         era_key = m.group(1)[:2]
         if era_key in _ERA_OFFSET:
             return _ERA_OFFSET[era_key] + int(m.group(2))
-    m = re.search(r'完成時期[^\d]*(\d{4})年', full_text)
+    m = _COMPLETION_YEAR_RE.search(full_text)
     if m:
         y = int(m.group(1))
         if 1950 <= y <= current_year:
             return y
 
     # Generic 築-prefixed era / western year in running text
-    era_pattern = re.compile(r'築[年月\s:：]*(?:(昭和|平成|令和)(\d{1,2})年|(\d{4})年)')
-    for m in era_pattern.finditer(full_text):
+    for m in _BUILT_YEAR_RE.finditer(full_text):
         era, era_yr, western_yr = m.group(1), m.group(2), m.group(3)
         if western_yr:
             y = int(western_yr)
@@ -358,7 +673,7 @@ def get_best_image(soup, url):
     # 2. Known ID/Classes
     selectors = ["#main_img", ".main_img", ".wp-post-image", ".item_img img", ".swiper-slide img"]
     for sel in selectors:
-        el = soup.select_one(sel)
+        el = select_first(soup, sel)
         if el and el.get("src"):
             src = el.get("src")
             src_lower = src.lower()
@@ -410,10 +725,10 @@ def get_suumo_image(soup, url):
     if og and og.get("content"):
         og_url = og.get("content")
         if not any(skip in og_url.lower() for skip in SKIP):
-            print(f"  [SUUMO IMG] og:image → {og_url[:80]}")
+            log.debug("  [SUUMO IMG] og:image → %s", og_url[:80])
             return urljoin(url, og_url)
         else:
-            print(f"  [SUUMO IMG] og:image skipped (matched skip keyword): {og_url[:80]}")
+            log.debug("  [SUUMO IMG] og:image skipped (matched skip keyword): %s", og_url[:80])
 
     # 2. SUUMO-specific property photo containers
     photo_selectors = [
@@ -430,7 +745,7 @@ def get_suumo_image(soup, url):
         if el:
             src = best_src(el)
             if src and not any(skip in src.lower() for skip in SKIP):
-                print(f"  [SUUMO IMG] selector '{sel}' → {src[:80]}")
+                log.debug("  [SUUMO IMG] selector '%s' → %s", sel, src[:80])
                 return urljoin(url, src)
 
     # 3. Full-page scan — check lazy attrs before src
@@ -465,7 +780,7 @@ def get_izutaiyo_image(soup, url, property_id):
         return img_url
 
     # Fallback: search HTML for bb/{dir}/{id}{letter}.jpg pattern
-    img_matches = re.findall(r'bb/\w+/\w+[a-z]\.jpg', str(soup))
+    img_matches = _IZUTAIYO_IMG_RE.findall(str(soup))
     if img_matches:
         return urljoin(url, img_matches[0])
 
@@ -500,6 +815,15 @@ def get_izutaiyo_image(soup, url, property_id):
 
     return get_best_image(soup, url)
 
+# Izu Taiyo titles open with the municipality: "下田市 白浜（…）の家情報"
+_TITLE_CITY_RES = (
+    re.compile(r'^([^「（]+?[市町村])'),  # City at start followed by city/town/village suffix
+    re.compile(r'^([^「（]+?[郡])'),      # District
+)
+_TITLE_ANY_CITY_RE = re.compile(r'^([^「（]+?[市町村郡])')
+# Prefecture-qualified municipality inside an address cell
+_PREF_CITY_RE = re.compile(r'(?:静岡県|神奈川県|千葉県|東京都|山梨県)\s*([^\s、,]{1,12}?[市町村])')
+
 def extract_actual_city_from_title(title):
     """
     Extract the actual city name from Izu Taiyo title format.
@@ -511,13 +835,8 @@ def extract_actual_city_from_title(title):
     if not title: return None
 
     # Common Japanese city/town suffixes
-    city_patterns = [
-        r'^([^「（]+?[市町村])',  # City at start followed by city/town/village suffix
-        r'^([^「（]+?[郡])',      # District
-    ]
-
-    for pattern in city_patterns:
-        match = re.search(pattern, title)
+    for pattern in _TITLE_CITY_RES:
+        match = pattern.search(title)
         if match:
             potential_city = match.group(1).strip()
             # Check if this is one of our target cities
@@ -547,14 +866,14 @@ def get_location_trust(soup, full_text, context_city=None):
 
     # 1. Try to extract city from title using proper parsing (Izu Taiyo format)
     h1 = soup.find("h1")
+    title_text = h1.get_text() if h1 else ""
     if h1:
-        city = extract_actual_city_from_title(h1.get_text())
+        city = extract_actual_city_from_title(title_text)
         if city: return city
         # If extract found a city but it's not in target list, it returned None
         # In that case, we know this property is in wrong area, so REJECT
-        title_text = h1.get_text()
         # Check if title starts with a city name that's not ours
-        if re.match(r'^[^「（]+?[市町村郡]', title_text):
+        if _TITLE_ANY_CITY_RE.match(title_text):
             # Title has a city name, but it's not in our target list
             # Return special marker to indicate this should be rejected
             return "WRONG_CITY"
@@ -564,7 +883,7 @@ def get_location_trust(soup, full_text, context_city=None):
     for tag in soup.find_all(["th", "td", "dt", "dd", "div", "span"]):
         tag_text = tag.get_text(strip=True)
         # Normalize whitespace for matching
-        tag_normalized = re.sub(r"\s+", "", tag_text)
+        tag_normalized = "".join(tag_text.split())
 
         # Skip large container div/span elements: find_all returns outer wrappers
         # before their children, and a wrapper's text combines property address
@@ -574,8 +893,7 @@ def get_location_trust(soup, full_text, context_city=None):
             continue
 
         for marker in markers:
-            marker_normalized = re.sub(r"\s+", "", marker)
-            if marker_normalized in tag_normalized:
+            if marker in tag_normalized:
                 # Check this tag and next siblings
                 candidates = [tag_text]
                 sib = tag.find_next_sibling()
@@ -590,13 +908,13 @@ def get_location_trust(soup, full_text, context_city=None):
                 # Address present but in a non-target city -> reject rather
                 # than fall through to the search-context fallback.
                 for c in candidates:
-                    m = re.search(r'(?:静岡県|神奈川県|千葉県|東京都|山梨県)\s*([^\s、,]{1,12}?[市町村])', c)
+                    m = _PREF_CITY_RE.search(c)
                     if m and not normalize_city(m.group(1)):
                         return "WRONG_CITY"
 
     # 3. Title with normalize_city
     if h1:
-        city = normalize_city(h1.get_text())
+        city = normalize_city(title_text)
         if city: return city
 
     # Also check h2 tags
@@ -621,46 +939,98 @@ def get_location_trust(soup, full_text, context_city=None):
 
 class BaseScraper:
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update(HEADERS)
+        # One session per scraper: IzuTaiyo sets a Referer header on its own.
+        self.session = make_session()
         self.items = []
         self.fetch_errors = 0   # non-200 or exception count
         self.pages_ok = 0       # successful fetches
+        self.lock = threading.Lock()  # guards the three fields above
+
+    def fetch(self, url, params=None, parse_only=None):
+        html = self.fetch_html(url, params)
+        return make_soup(html, parse_only) if html is not None else None
+
+    def fetch_detail(self, url, context_city=None, drop=()):
+        """fetch() for a detail page, or None without parsing it when the raw
+        page can't pass the sea-view filter or, lacking a context city to fall
+        back on, contains no target city name (both counted as skipped_loc).
 
-    def fetch(self, url, params=None):
+        Elements named in drop (page chrome such as footer/nav) are removed
+        from the tree; the tree is only searched for the ones whose opening
+        tag actually occurs in the raw HTML.
+        """
+        html = self.fetch_html(url)
+        if html is None:
+            return None
+        if not could_score_sea_view(html):
+            log.debug("  [SEA VIEW FILTERED] No sea keywords on page: %s", url[:60])
+            inc_stat("skipped_loc")
+            return None
+        if not context_city and not normalize_city(html):
+            log.debug("  [LOCATION FILTERED] No target city on page: %s", url[:60])
+            inc_stat("skipped_loc")
+            return None
+        soup = make_soup(html)
+        if drop:
+            present = {t.lower() for t in _CHROME_TAG_RE.findall(html)}
+            names = [t for t in drop if t in present]
+            if names:
+                for tag in soup.find_all(names):
+                    tag.decompose()
+        return soup
+
+    def fetch_html(self, url, params=None):
+        """GET url and return the decoded page text, or None on failure."""
         try:
-            r = self.session.get(url, params=params, timeout=15, verify=False)
+            host_pace(url)
+            with host_slot(url):
+                r = self.session.get(url, params=params, timeout=15, verify=False)
             # Accept any 2xx/3xx as success, not just exactly 200.
             if r.status_code >= 400:
-                print(f"  [HTTP {r.status_code}] {url[:80]}")
+                log.warning(f"  [HTTP {r.status_code}] {url[:80]}")
                 inc_stat("error")
-                self.fetch_errors += 1
+                with self.lock:
+                    self.fetch_errors += 1
                 return None
-            r.encoding = r.apparent_encoding
-            self.pages_ok += 1
-            return BeautifulSoup(r.text, "html.parser")
+            text = response_text(r)
+            with self.lock:
+                self.pages_ok += 1
+            return text
         except Exception as e:
-            print(f"  [FETCH ERROR] {url[:80]}: {e}")
+            log.warning(f"  [FETCH ERROR] {url[:80]}: {e}")
             inc_stat("error")
-            self.fetch_errors += 1
+            with self.lock:
+                self.fetch_errors += 1
             return None
 
     def add_item(self, item):
-        self.items.append(item)
-        print(f"  [SAVED] {item['source']}: {item['city']} - {item['title'][:30]}")
+        with self.lock:
+            self.items.append(item)
+        log.info(f"  [SAVED] {item['source']}: {item['city']} - {item['title'][:30]}")
+
+    def parse_all(self, jobs):
+        """Run self.parse_detail(*job) for each job on DETAIL_WORKERS threads.
+
+        Each job's first element is its detail URL. Saved items are put back
+        in job order afterwards so listings.json stays stable between runs.
+        """
+        with ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as executor:
+            list(executor.map(lambda job: self.parse_detail(*job), jobs))
+        order = {job[0]: i for i, job in enumerate(jobs)}
+        self.items.sort(key=lambda it: order.get(it["sourceUrl"], len(order)))
 
 class IzuTaiyo(BaseScraper):
     def run(self):
-        print("--- Scanning Izu Taiyo ---")
+        log.info("--- Scanning Izu Taiyo ---")
         # Warm up the session by visiting the search form first.
         # Some servers require a prior page visit / cookie before accepting sa.php.
         SEARCH_FORM_URL = "https://www.izutaiyo.co.jp/s.php"
         SEARCH_RESULTS_URL = "https://www.izutaiyo.co.jp/sa.php"
         warmup = self.fetch(SEARCH_FORM_URL)
         if warmup:
-            print("  [Izu Taiyo] Session warm-up OK")
+            log.info("  [Izu Taiyo] Session warm-up OK")
         else:
-            print("  [WARNING] Izu Taiyo: warm-up fetch of s.php failed — site may be blocking")
+            log.warning("  [WARNING] Izu Taiyo: warm-up fetch of s.php failed — site may be blocking")
         # Tell the server we navigated from the search form
         self.session.headers.update({"Referer": SEARCH_FORM_URL})
 
@@ -704,12 +1074,13 @@ class IzuTaiyo(BaseScraper):
                     if page > 1:
                         params['page'] = page - 1
 
-                    print(f"  Fetching {city_name} {type_name} (page {page})...")
+                    log.info(f"  Fetching {city_name} {type_name} (page {page})...")
 
-                    soup = self.fetch(search_url, params=params)
-                    if not soup:
-                        print(f"  [WARNING] Failed to fetch {city_name} {type_name} page {page}")
+                    html = self.fetch_html(search_url, params=params)
+                    if html is None:
+                        log.warning(f"  [WARNING] Failed to fetch {city_name} {type_name} page {page}")
                         break
+                    soup = make_soup(html)
 
                     page_text = soup.get_text()
                     if '見つかりませんでした' in page_text or '該当する物件がありません' in page_text or '該当物件はありません' in page_text:
@@ -722,14 +1093,9 @@ class IzuTaiyo(BaseScraper):
                         onclick = tag.get("onclick", "")
 
                         # Try multiple patterns for property IDs
-                        # Pattern 1: d.php?hpno=XXX
-                        match = re.search(r"d\.php\?hpno=(\w+)", onclick)
-                        if not match:
-                            # Pattern 2: 'hpno=XXX' (without d.php)
-                            match = re.search(r"['\"]hpno=(\w+)", onclick)
-                        if not match:
-                            # Pattern 3: hpno = 'XXX'
-                            match = re.search(r"hpno\s*=\s*['\"](\w+)", onclick)
+                        for pattern in _ONCLICK_HPNO_RES:
+                            match = pattern.search(onclick)
+                            if match: break
 
                         if match:
                             d_link = f"https://www.izutaiyo.co.jp/d.php?hpno={match.group(1)}"
@@ -738,11 +1104,9 @@ class IzuTaiyo(BaseScraper):
                                 page_found_count += 1
 
                         # Also check for hpbunno
-                        match = re.search(r"d\.php\?hpbunno=([^'\"&]+)", onclick)
-                        if not match:
-                            match = re.search(r"['\"]hpbunno=([^'\"&]+)", onclick)
-                        if not match:
-                            match = re.search(r"hpbunno\s*=\s*['\"]([^'\"&]+)", onclick)
+                        for pattern in _ONCLICK_HPBUNNO_RES:
+                            match = pattern.search(onclick)
+                            if match: break
 
                         if match:
                             d_link = f"https://www.izutaiyo.co.jp/d.php?hpbunno={match.group(1).strip()}"
@@ -754,46 +1118,52 @@ class IzuTaiyo(BaseScraper):
                     for a in soup.find_all("a", href=True):
                         href = a['href']
                         if "d.php" in href and ("hpno=" in href or "hpbunno=" in href):
-                            full = urljoin("https://www.izutaiyo.co.jp", href)
+                            # Rebuild the same d.php URL the onclick branches
+                            # produce, dropping extra params and sp/ prefixes
+                            match = (_HREF_HPNO_RE.search(href) or
+                                     _HREF_HPBUNNO_RE.search(href))
+                            if match:
+                                full = f"https://www.izutaiyo.co.jp/d.php?{match.group(1)}"
+                            else:
+                                full = urljoin("https://www.izutaiyo.co.jp", href)
                             if full not in found_links:
                                 found_links[full] = (city_name, type_name.lower())
                                 page_found_count += 1
 
                     # FALLBACK: Search raw HTML for d.php links (catches JS-rendered or hidden links)
                     if page_found_count == 0:
-                        html_str = str(soup)
-                        for prop_id in re.findall(r'd\.php\?hpno=(\w+)', html_str):
+                        for prop_id in _RAW_HPNO_RE.findall(html):
                             d_link = f"https://www.izutaiyo.co.jp/d.php?hpno={prop_id}"
                             if d_link not in found_links:
                                 found_links[d_link] = (city_name, type_name.lower())
                                 page_found_count += 1
-                        for prop_id in re.findall(r'd\.php\?hpbunno=([^\'\"&\s]+)', html_str):
+                        for prop_id in _RAW_HPBUNNO_RE.findall(html):
                             d_link = f"https://www.izutaiyo.co.jp/d.php?hpbunno={prop_id}"
                             if d_link not in found_links:
                                 found_links[d_link] = (city_name, type_name.lower())
                                 page_found_count += 1
 
                     if page_found_count == 0:
-                        print(f"    No new properties on page {page}, ending pagination")
+                        log.info(f"    No new properties on page {page}, ending pagination")
                         break
                     else:
-                        print(f"    Found {page_found_count} new properties on page {page}")
+                        log.info(f"    Found {page_found_count} new properties on page {page}")
 
                     page += 1
 
         if not found_links:
-            print("  [WARNING] Izu Taiyo: 0 candidates found across all searches — "
+            log.warning("  [WARNING] Izu Taiyo: 0 candidates found across all searches — "
                   f"fetch errors={self.fetch_errors}, pages OK={self.pages_ok}. "
                   "Site structure may have changed or requests are being blocked.")
-        print(f"  > Processing {len(found_links)} unique listings...")
+        log.info(f"  > Processing {len(found_links)} unique listings...")
 
-        for link, (city_ctx, search_cat) in found_links.items():
-            self.parse_detail(link, city_ctx, search_cat)
-            sleep_jitter()
+        self.parse_all([(link, city_ctx, search_cat)
+                        for link, (city_ctx, search_cat) in found_links.items()])
 
     def parse_detail(self, url, city_ctx, search_category=None):
         inc_stat("scanned")
-        soup = self.fetch(url)
+        # Footer and nav can contain misleading location info
+        soup = self.fetch_detail(url, city_ctx, drop=("footer", "nav"))
         if not soup: return
 
         # Extract property ID from URL for image lookup
@@ -803,32 +1173,27 @@ class IzuTaiyo(BaseScraper):
         elif "hpbunno=" in url:
             property_id = url.split("hpbunno=")[1].split("&")[0]
 
-        # Remove footer and nav (can contain misleading location info)
-        for tag in soup.find_all(["footer", "nav", ".footer", ".navigation"]):
-            tag.decompose()
-
-        title = clean_text(soup.find("h1").get_text()) if soup.find("h1") else "Izu Taiyo Property"
+        h1 = soup.find("h1")
+        h1_text = h1.get_text() if h1 else ""
+        title = clean_text(h1_text) if h1 else "Izu Taiyo Property"
         full_text = clean_text(soup.get_text())
 
         # 1. Location FIRST - Filter wrong cities before anything else
         city = get_location_trust(soup, full_text, city_ctx)
         if city == "WRONG_CITY" or not city:
-            # Extract city name from title for debug
-            title_preview = title if len(title) < 40 else title[:37] + "..."
-            if city == "WRONG_CITY":
-                # Extract the actual wrong city name for better logging
-                h1 = soup.find("h1")
-                if h1:
-                    match = re.match(r'^([^「（]+?[市町村郡])', h1.get_text())
+            # Extract city name from title for debug (skipped unless DEBUG is on)
+            if log.isEnabledFor(logging.DEBUG):
+                title_preview = title if len(title) < 40 else title[:37] + "..."
+                if city == "WRONG_CITY":
+                    # Extract the actual wrong city name for better logging
+                    match = _TITLE_ANY_CITY_RE.match(h1_text) if h1 else None
                     if match:
                         wrong_city = match.group(1).strip()
-                        print(f"  [LOCATION FILTERED] Wrong city {wrong_city}: {title_preview}")
+                        log.debug("  [LOCATION FILTERED] Wrong city %s: %s", wrong_city, title_preview)
                     else:
-                        print(f"  [LOCATION FILTERED] Not in target area: {title_preview}")
+                        log.debug("  [LOCATION FILTERED] Not in target area: %s", title_preview)
                 else:
-                    print(f"  [LOCATION FILTERED] Not in target area: {title_preview}")
-            else:
-                print(f"  [LOCATION FILTERED] Could not determine city: {title_preview}")
+                    log.debug("  [LOCATION FILTERED] Could not determine city: %s", title_preview)
             inc_stat("skipped_loc")
             return
 
@@ -838,40 +1203,14 @@ class IzuTaiyo(BaseScraper):
             return
 
         # 3. Sea View Scoring (Tiered for accuracy)
-        sea_score = 0
-
-        # Check for explicit "no sea view" statements first
-        if "海は見えません" in full_text or "海眺望なし" in full_text or "海見えず" in full_text:
-            sea_score = 0
-        # HIGH: Explicit sea view language
-        elif any(k in full_text for k in HIGH_SEA_KEYWORDS):
-            sea_score = 4
-        # MEDIUM: Famous beach names or ocean names
-        elif any(k in full_text for k in MEDIUM_SEA_KEYWORDS):
-            sea_score = 3
-        # LOW: Walking distance to sea (stricter check to avoid false positives)
-        elif any(k in full_text for k in ["海", "ビーチ", "Beach"]):
-            # Require explicit distance/time measurements to avoid false positives
-            # Must have numbers: "海まで徒歩5分", "海から100m", etc.
-            proximity_patterns = [
-                r"海まで徒歩[0-9０-９]",          # 海まで徒歩5分
-                r"海まで.*[0-9０-９]+.*分",       # 海まで約5分
-                r"海まで.*[0-9０-９]+.*[mｍメートル]",  # 海まで100m
-                r"海から[0-9０-９]+.*[mｍメートル]",    # 海から100m
-                r"徒歩[0-9０-９]+.*分.*海",       # 徒歩5分で海
-                r"ビーチまで.*[0-9０-９]+",      # ビーチまで5分
-                r"海.*徒歩圏",                    # 海が徒歩圏内
-            ]
-            if any(re.search(pattern, full_text) for pattern in proximity_patterns):
-                sea_score = 2
-            # Just generic "海" mention without distance/time = score 0
+        sea_score = score_sea_view(full_text)
 
         # 5. Filter by sea view score - only include properties with clear sea connection
         # Minimum score of 2 required (explicit proximity or better)
         MIN_SEA_SCORE = 2
         if sea_score < MIN_SEA_SCORE:
             title_preview = title if len(title) < 40 else title[:37] + "..."
-            print(f"  [SEA VIEW FILTERED] Insufficient sea connection (score={sea_score}): {title_preview}")
+            log.debug("  [SEA VIEW FILTERED] Insufficient sea connection (score=%s): %s", sea_score, title_preview)
             inc_stat("skipped_loc")  # Count as location filter
             return
 
@@ -879,15 +1218,15 @@ class IzuTaiyo(BaseScraper):
         price = 0
 
         # Try h1 first (most reliable for Izu Taiyo - contains the main price)
-        h1 = soup.find("h1")
         if h1:
-            price = extract_price(h1.get_text())
+            price = extract_price(h1_text)
 
         # Try table rows with price keywords
         if price == 0:
             for tr in soup.find_all("tr"):
                 tr_text = tr.get_text()
-                if any(k in tr_text for k in ["価格", "販売価格", "売買価格", "Price"]):
+                # 販売価格 / 売買価格 are covered by 価格
+                if "価格" in tr_text or "Price" in tr_text:
                     price = extract_price(tr_text)
                     if price > 0: break
 
@@ -898,7 +1237,7 @@ class IzuTaiyo(BaseScraper):
         # 6. Price validation - Exclude properties with no price (likely sold/unavailable)
         if not price or price <= 0:
             title_preview = title if len(title) < 40 else title[:37] + "..."
-            print(f"  [PRICE FILTERED] No valid price found: {title_preview} (price={price})")
+            log.debug("  [PRICE FILTERED] No valid price found: %s (price=%s)", title_preview, price)
             inc_stat("skipped_sold")
             return
 
@@ -912,12 +1251,16 @@ class IzuTaiyo(BaseScraper):
         year_built = extract_year_built(soup, full_text)
         address = extract_address_str(soup)
 
+        # English title from the display-group city (河津 → Higashi-Izu); the
+        # stored city stays as resolved, map.html has its own 河津 centre
+        city_en = CITY_EN_MAP.get(normalize_city(city) or city, city)
+
         item = {
             "id": stable_id("izutaiyo", url),
             "source": "Izu Taiyo",
             "sourceUrl": url,
             "title": title,
-            "titleEn": f"{CITY_EN_MAP.get(normalize_city(city), city)} Property",
+            "titleEn": f"{city_en} Property",
             "propertyType": ptype,
             "city": city,
             "priceJpy": price,
@@ -932,7 +1275,7 @@ class IzuTaiyo(BaseScraper):
 
 class Maple(BaseScraper):
     def run(self):
-        print("--- Scanning Maple ---")
+        log.info("--- Scanning Maple ---")
         # Try multiple pages and pagination
         base_urls = [
             "https://www.maple-h.co.jp/estate_db/house/",
@@ -945,16 +1288,16 @@ class Maple(BaseScraper):
         candidates = set()
 
         for u in base_urls:
-            soup = self.fetch(u)
+            soup = self.fetch(u, parse_only=LINKS_ONLY)
             if not soup:
-                print(f"  [WARNING] Failed to fetch {u}")
+                log.warning(f"  [WARNING] Failed to fetch {u}")
                 continue
 
             # Extract property links - ignore article blocks since they don't exist
             # Just look for estate_db links that aren't navigation
             for a in soup.find_all("a", href=True):
                 href = a.get("href", "")
-                full = urljoin(u, href)
+                full = canonical_url(urljoin(u, href))
 
                 # Must contain estate_db
                 if "maple-h.co.jp/estate_db/" not in full:
@@ -988,10 +1331,8 @@ class Maple(BaseScraper):
                         continue
                     candidates.add(full)
 
-        print(f"  > Processing {len(candidates)} candidates...")
-        for link in sorted(candidates):
-            self.parse_detail(link)
-            sleep_jitter()
+        log.info(f"  > Processing {len(candidates)} candidates...")
+        self.parse_all([(link,) for link in sorted(candidates)])
 
     def parse_detail(self, url):
         # IMMEDIATE REJECTION: Category pages (bulletproof check)
@@ -999,19 +1340,19 @@ class Maple(BaseScraper):
         if url_lower.endswith('estate_db/office') or url_lower.endswith('estate_db/lease') or \
            url_lower.endswith('estate_db/mansion') or url_lower.endswith('estate_db/house') or \
            url_lower.endswith('estate_db/estate') or url_lower.endswith('estate_db/land'):
-            print(f"  [CATEGORY PAGE FILTERED] {url}")
+            log.debug("  [CATEGORY PAGE FILTERED] %s", url)
             return
 
-        print(f"  [MAPLE] Processing property: {url[:80]}")
+        log.debug("  [MAPLE] Processing property: %s", url[:80])
         inc_stat("scanned")
 
-        soup = self.fetch(url)
+        soup = self.fetch_detail(url)
         if not soup: return
 
         # Title extraction - try multiple selectors
         title = ""
         for selector in ["h1.entry-title", "h1", ".property-title", "title"]:
-            elem = soup.select_one(selector)
+            elem = select_first(soup, selector)
             if elem:
                 title = clean_text(elem.get_text())
                 if "|" in title: title = title.split("|")[0]
@@ -1051,40 +1392,22 @@ class Maple(BaseScraper):
 
         city = get_location_trust(soup, full_text)
         if city == "WRONG_CITY" or not city:
-            print(f"  [LOCATION FILTERED] Maple - {city}: {url[:80]}")
+            log.debug("  [LOCATION FILTERED] Maple - %s: %s", city, url[:80])
             inc_stat("skipped_loc")
             return
 
         # Sea View Scoring (Tiered for accuracy)
-        sea_score = 0
-        if "海は見えません" in full_text or "海眺望なし" in full_text or "海見えず" in full_text:
-            sea_score = 0
-        elif any(k in full_text for k in HIGH_SEA_KEYWORDS):
-            sea_score = 4
-        elif any(k in full_text for k in MEDIUM_SEA_KEYWORDS):
-            sea_score = 3
-        elif any(k in full_text for k in ["海", "ビーチ", "Beach"]):
-            proximity_patterns = [
-                r"海まで徒歩[0-9０-９]",
-                r"海まで.*[0-9０-９]+.*分",
-                r"海まで.*[0-9０-９]+.*[mｍメートル]",
-                r"海から[0-9０-９]+.*[mｍメートル]",
-                r"徒歩[0-9０-９]+.*分.*海",
-                r"ビーチまで.*[0-9０-９]+",
-                r"海.*徒歩圏",
-            ]
-            if any(re.search(p, full_text) for p in proximity_patterns):
-                sea_score = 2
+        sea_score = score_sea_view(full_text)
 
         if sea_score < 2:
-            print(f"  [SEA VIEW FILTERED] Maple - Insufficient sea connection (score={sea_score}): {url[:60]}")
+            log.debug("  [SEA VIEW FILTERED] Maple - Insufficient sea connection (score=%s): %s", sea_score, url[:60])
             inc_stat("skipped_loc")
             return
 
         price = extract_price(full_text)
 
         if not price or price <= 0:
-            print(f"  [PRICE FILTERED] No valid price found: {url} (price={price})")
+            log.debug("  [PRICE FILTERED] No valid price found: %s (price=%s)", url, price)
             inc_stat("skipped_sold")
             return
 
@@ -1102,12 +1425,14 @@ class Maple(BaseScraper):
         year_built = extract_year_built(soup, full_text)
         address = extract_address_str(soup)
 
+        city_en = CITY_EN_MAP.get(normalize_city(city) or city, city)
+
         item = {
             "id": stable_id("maple", url),
             "source": "Maple Housing",
             "sourceUrl": url,
             "title": title,
-            "titleEn": f"{CITY_EN_MAP.get(normalize_city(city), city)} Property",
+            "titleEn": f"{city_en} Property",
             "propertyType": ptype,
             "city": city,
             "priceJpy": price,
@@ -1122,7 +1447,7 @@ class Maple(BaseScraper):
 
 class Aoba(BaseScraper):
     def run(self):
-        print("--- Scanning Aoba ---")
+        log.info("--- Scanning Aoba ---")
         # Target area codes (Shimoda, Kawazu, Higashi-Izu, Minami-Izu)
         target_codes = {
             "ao22219": "下田",      # Shimoda
@@ -1148,16 +1473,16 @@ class Aoba(BaseScraper):
         candidates = set()
 
         for u in urls:
-            soup = self.fetch(u)
+            soup = self.fetch(u, parse_only=LINKS_ONLY)
             if not soup:
-                print(f"  [WARNING] Failed to fetch {u}")
+                log.warning(f"  [WARNING] Failed to fetch {u}")
                 continue
 
             # Find all property links - be more permissive initially
             # We'll filter by actual location in parse_detail()
             for a in soup.find_all("a", href=True):
                 href = a['href']
-                full = urljoin("https://www.aoba-resort.com", href)
+                full = canonical_url(urljoin("https://www.aoba-resort.com", href))
 
                 # Look for property pages (room + .html or /house/ or /land/)
                 is_property = False
@@ -1178,40 +1503,35 @@ class Aoba(BaseScraper):
                     if not has_exclude and full not in urls:
                         candidates.add(full)
 
-            print(f"    Found {len(candidates)} candidate property links (before location filtering)")
+            log.info(f"    Found {len(candidates)} candidate property links (before location filtering)")
 
-        print(f"  > Found {len(candidates)} property pages total")
+        log.info(f"  > Found {len(candidates)} property pages total")
 
         if len(candidates) == 0:
-            print(f"  [WARNING] Aoba: No property links found on any pages!")
-            print(f"  [WARNING] This could indicate:")
-            print(f"             - Website structure has changed")
-            print(f"             - No properties currently listed")
-            print(f"             - Link detection logic needs updating")
+            log.warning(f"  [WARNING] Aoba: No property links found on any pages!")
+            log.warning(f"  [WARNING] This could indicate:")
+            log.warning(f"             - Website structure has changed")
+            log.warning(f"             - No properties currently listed")
+            log.warning(f"             - Link detection logic needs updating")
             return
 
-        print(f"  > Processing {len(candidates)} candidates (will filter by city later)...")
+        log.info(f"  > Processing {len(candidates)} candidates (will filter by city later)...")
 
         # Process all candidates - parse_detail will filter by city
         aoba_before = len(self.items)
-        for link in sorted(candidates):
-            self.parse_detail(link)
-            sleep_jitter()
+        self.parse_all([(link,) for link in sorted(candidates)])
 
         aoba_after = len(self.items)
         aoba_saved = aoba_after - aoba_before
-        print(f"  > Aoba: Saved {aoba_saved} out of {len(candidates)} candidates")
+        log.info(f"  > Aoba: Saved {aoba_saved} out of {len(candidates)} candidates")
         if aoba_saved == 0 and len(candidates) > 0:
-            print(f"  [WARNING] All Aoba properties were filtered out!")
-            print(f"  [WARNING] Check: sea view requirements, location matching, price validation")
+            log.warning(f"  [WARNING] All Aoba properties were filtered out!")
+            log.warning(f"  [WARNING] Check: sea view requirements, location matching, price validation")
 
     def parse_detail(self, url):
         inc_stat("scanned")
 
-        print(f"  [AOBA] Parsing: {url[:80]}")
-
-        soup = self.fetch(url)
-        if not soup: return
+        log.debug("  [AOBA] Parsing: %s", url[:80])
 
         # Extract city from URL as context (Aoba uses area codes in URLs)
         url_city_map = {
@@ -1226,6 +1546,9 @@ class Aoba(BaseScraper):
                 url_city = city_name
                 break
 
+        soup = self.fetch_detail(url, url_city)
+        if not soup: return
+
         # Extract title: prefer h1, then h2 (skipping map-section headers like "地図MAP")
         title = ""
         h1 = soup.find("h1")
@@ -1244,7 +1567,7 @@ class Aoba(BaseScraper):
 
         if not title:
             for selector in [".property-title", ".entry-title"]:
-                elem = soup.select_one(selector)
+                elem = select_first(soup, selector)
                 if elem:
                     candidate = clean_text(elem.get_text())
                     if candidate:
@@ -1264,47 +1587,29 @@ class Aoba(BaseScraper):
         # Use URL city as context if available
         city = get_location_trust(soup, full_text, url_city)
         if city == "WRONG_CITY":
-            print(f"  [LOCATION FILTERED] Wrong city detected: {url}")
+            log.debug("  [LOCATION FILTERED] Wrong city detected: %s", url)
             inc_stat("skipped_loc")
             return
         if not city:
             if url_city:
                 city = url_city
             else:
-                print(f"  [WARNING] Could not determine city for: {url}")
+                log.warning(f"  [WARNING] Could not determine city for: {url}")
                 inc_stat("skipped_loc")
                 return
 
         # Sea View Scoring (Tiered for accuracy)
-        sea_score = 0
-        if "海は見えません" in full_text or "海眺望なし" in full_text or "海見えず" in full_text:
-            sea_score = 0
-        elif any(k in full_text for k in HIGH_SEA_KEYWORDS):
-            sea_score = 4
-        elif any(k in full_text for k in MEDIUM_SEA_KEYWORDS):
-            sea_score = 3
-        elif any(k in full_text for k in ["海", "ビーチ", "Beach"]):
-            proximity_patterns = [
-                r"海まで徒歩[0-9０-９]",
-                r"海まで.*[0-9０-９]+.*分",
-                r"海まで.*[0-9０-９]+.*[mｍメートル]",
-                r"海から[0-9０-９]+.*[mｍメートル]",
-                r"徒歩[0-9０-９]+.*分.*海",
-                r"ビーチまで.*[0-9０-９]+",
-                r"海.*徒歩圏",
-            ]
-            if any(re.search(p, full_text) for p in proximity_patterns):
-                sea_score = 2
+        sea_score = score_sea_view(full_text)
 
         if sea_score < 2:
-            print(f"  [SEA VIEW FILTERED] Aoba - Insufficient sea connection (score={sea_score}): {url[:60]}")
+            log.debug("  [SEA VIEW FILTERED] Aoba - Insufficient sea connection (score=%s): %s", sea_score, url[:60])
             inc_stat("skipped_loc")
             return
 
         price = extract_price(full_text)
 
         if not price or price <= 0:
-            print(f"  [PRICE FILTERED] No valid price found: {url} (price={price})")
+            log.debug("  [PRICE FILTERED] No valid price found: %s (price=%s)", url, price)
             inc_stat("skipped_sold")
             return
 
@@ -1313,12 +1618,14 @@ class Aoba(BaseScraper):
         year_built = extract_year_built(soup, full_text)
         address = extract_address_str(soup)
 
+        city_en = CITY_EN_MAP.get(normalize_city(city) or city, city)
+
         item = {
             "id": stable_id("aoba", url),
             "source": "Aoba Resort",
             "sourceUrl": url,
             "title": title,
-            "titleEn": f"{CITY_EN_MAP.get(normalize_city(city), city)} Property",
+            "titleEn": f"{city_en} Property",
             "propertyType": ptype,
             "city": city,
             "priceJpy": price,
@@ -1353,7 +1660,7 @@ class Suumo(BaseScraper):
     ]
 
     def run(self):
-        print("--- Scanning SUUMO ---")
+        log.info("--- Scanning SUUMO ---")
         candidates = {}  # url -> city_ctx
 
         for path, city_hint in self.SEARCH_PAGES:
@@ -1365,42 +1672,40 @@ class Suumo(BaseScraper):
                 if page > 1:
                     url = f"{url}?page={page}"
 
-                print(f"  SUUMO {kind} {area} page {page}: {url}")
+                log.info(f"  SUUMO {kind} {area} page {page}: {url}")
                 try:
+                    host_pace(url)
                     r = self.session.get(url, timeout=15, verify=False)
                 except Exception as e:
-                    print(f"  [SUUMO] Network error: {e}")
+                    log.warning(f"  [SUUMO] Network error: {e}")
                     break
 
                 if r.status_code == 403:
-                    print("  [SUUMO] Access denied (403) – site blocks automated requests, skipping.")
+                    log.warning("  [SUUMO] Access denied (403) – site blocks automated requests, skipping.")
                     return
                 if r.status_code != 200:
-                    print(f"  [SUUMO] HTTP {r.status_code} for {url}, stopping.")
+                    log.warning(f"  [SUUMO] HTTP {r.status_code} for {url}, stopping.")
                     break
 
-                r.encoding = r.apparent_encoding
-                soup = BeautifulSoup(r.text, "html.parser")
+                soup = make_soup(response_text(r))
 
                 links = self._extract_links(soup, city_hint)
                 if not links:
-                    print(f"    No listings on page {page}, stopping.")
+                    log.info(f"    No listings on page {page}, stopping.")
                     break
 
                 new = {u: c for u, c in links.items() if u not in candidates}
                 candidates.update(new)
-                print(f"    +{len(new)} new links (total {len(candidates)})")
+                log.info(f"    +{len(new)} new links (total {len(candidates)})")
 
                 # Stop if there is no "next page" control
-                if not soup.find("a", string=re.compile(r"次へ|次のページ|›|>")):
+                if not soup.find("a", string=_NEXT_PAGE_RE):
                     break
                 page += 1
-                sleep_jitter()
 
-        print(f"  > Visiting {len(candidates)} SUUMO detail pages...")
-        for url, (city_ctx, thumb_url) in candidates.items():
-            self.parse_detail(url, city_ctx, thumb_url)
-            sleep_jitter()
+        log.info(f"  > Visiting {len(candidates)} SUUMO detail pages...")
+        self.parse_all([(url, city_ctx, thumb_url)
+                        for url, (city_ctx, thumb_url) in candidates.items()])
 
     def _extract_links(self, soup, city_hint=None):
         """Pull property detail-page URLs out of a SUUMO search results page.
@@ -1410,20 +1715,20 @@ class Suumo(BaseScraper):
         on search result pages even though detail pages load photos via JS.
         """
         found = {}
-        for a in soup.find_all("a", href=re.compile(r"/nc_\d+")):
+        for a in soup.find_all("a", href=_NC_HREF_RE):
             href = a["href"]
             # SUUMO search pages embed "recommended" cards from other cities
             # (e.g. sc_shizuokashisuruga = Shizuoka City). Detail URLs carry
             # the true city slug, so only keep target-area links.
             if ("/sc_shimoda/" not in href) and ("/sc_kamogun/" not in href):
                 continue
-            full = urljoin(self.BASE, href)
+            full = canonical_url(urljoin(self.BASE, href))
             if full in found:
                 continue
             # Try to detect city from surrounding card; fall back to page hint
             city_ctx = city_hint
             thumb_url = ""
-            card = a.find_parent(class_=re.compile(r"cassette|item|property", re.I))
+            card = a.find_parent(class_=_CARD_CLASS_RE)
             if card:
                 detected = normalize_city(card.get_text())
                 if detected:
@@ -1431,25 +1736,29 @@ class Suumo(BaseScraper):
                 # Grab the first property image from the card thumbnail area.
                 # SUUMO search result pages include gazo/bukken images in static HTML.
                 for img in card.find_all("img"):
-                    for attr in ["src", "data-src", "data-lazy", "data-original"]:
-                        v = img.get(attr, "")
-                        if v and "img01.suumo.com" in v and ("gazo/bukken" in v or "gazo%2fbukken" in v.lower()):
-                            thumb_url = v
-                            break
+                    thumb_url = self._thumb(img)
                     if thumb_url:
                         break
             found[full] = (city_ctx, thumb_url)
         return found
 
+    @staticmethod
+    def _thumb(img):
+        """First lazy-load/src attribute of *img* holding a SUUMO property photo."""
+        for attr in _THUMB_ATTRS:
+            v = img.get(attr)
+            if not v or "img01.suumo.com" not in v:
+                continue
+            if "gazo/bukken" in v or ("%2" in v and "gazo%2fbukken" in v.lower()):
+                return v
+        return ""
+
     def parse_detail(self, url, city_ctx, thumb_url=""):
         inc_stat("scanned")
-        soup = self.fetch(url)
+        soup = self.fetch_detail(url, city_ctx, drop=("footer", "nav", "header"))
         if not soup:
             return
 
-        for tag in soup.find_all(["footer", "nav", "header"]):
-            tag.decompose()
-
         h = soup.find("h1") or soup.find("h2")
         title = clean_text(h.get_text()) if h else "SUUMO Property"
         full_text = clean_text(soup.get_text())
@@ -1464,28 +1773,10 @@ class Suumo(BaseScraper):
             return
 
         # Sea view scoring (same thresholds as other scrapers)
-        sea_score = 0
-        if "海は見えません" in full_text or "海眺望なし" in full_text or "海見えず" in full_text:
-            sea_score = 0
-        elif any(k in full_text for k in HIGH_SEA_KEYWORDS):
-            sea_score = 4
-        elif any(k in full_text for k in MEDIUM_SEA_KEYWORDS):
-            sea_score = 3
-        elif any(k in full_text for k in ["海", "ビーチ", "Beach"]):
-            proximity_patterns = [
-                r"海まで徒歩[0-9０-９]",
-                r"海まで.*[0-9０-９]+.*分",
-                r"海まで.*[0-9０-９]+.*[mｍメートル]",
-                r"海から[0-9０-９]+.*[mｍメートル]",
-                r"徒歩[0-9０-９]+.*分.*海",
-                r"ビーチまで.*[0-9０-９]+",
-                r"海.*徒歩圏",
-            ]
-            if any(re.search(p, full_text) for p in proximity_patterns):
-                sea_score = 2
+        sea_score = score_sea_view(full_text)
 
         if sea_score < 2:
-            print(f"  [SEA VIEW FILTERED] SUUMO score={sea_score}: {url[:60]}")
+            log.debug("  [SEA VIEW FILTERED] SUUMO score=%s: %s", sea_score, url[:60])
             inc_stat("skipped_loc")
             return
 
@@ -1509,12 +1800,14 @@ class Suumo(BaseScraper):
         year_built = extract_year_built(soup, full_text)
         address = extract_address_str(soup)
 
+        city_en = CITY_EN_MAP.get(normalize_city(city) or city, city)
+
         item = {
             "id": stable_id("suumo", url),
             "source": "SUUMO",
             "sourceUrl": url,
             "title": title,
-            "titleEn": f"{CITY_EN_MAP.get(city, city)} Property",
+            "titleEn": f"{city_en} Property",
             "propertyType": prop_type,
             "city": city,
             "priceJpy": price,
@@ -1530,7 +1823,7 @@ class Suumo(BaseScraper):
 
 class IzuMirai(BaseScraper):
     def run(self):
-        print("--- Scanning Izu Mirai ---")
+        log.info("--- Scanning Izu Mirai ---")
         # Area-specific sale pages for each target city
         base_urls = [
             ("https://www.izumirai.com/area1b2/city_cr22302/", "河津"),   # Kawazu
@@ -1543,36 +1836,34 @@ class IzuMirai(BaseScraper):
         for base_url, city_hint in base_urls:
             for page in range(1, 6):  # up to 5 pages per area
                 page_url = base_url if page == 1 else f"{base_url}page/{page}/"
-                soup = self.fetch(page_url)
+                soup = self.fetch(page_url, parse_only=LINKS_ONLY)
                 if not soup:
                     break
 
                 found_on_page = 0
                 for a in soup.find_all("a", href=True):
-                    full = urljoin(page_url, a["href"])
-                    if re.search(r'/bkndetail/\d+/', full) and 'izumirai.com' in full:
+                    full = canonical_url(urljoin(page_url, a["href"]))
+                    if _BKNDETAIL_RE.search(full) and 'izumirai.com' in full:
                         # Normalise to canonical: strip /room\d+/ suffix
-                        canonical = re.sub(r'/room\d+/?$', '/', full.rstrip('/') + '/')
+                        canonical = _ROOM_SUFFIX_RE.sub('/', full.rstrip('/') + '/')
                         candidates.add(canonical)
                         found_on_page += 1
 
                 if found_on_page == 0:
                     break  # no more pages for this area
 
-        print(f"  > Processing {len(candidates)} candidates...")
-        for link in sorted(candidates):
-            self.parse_detail(link)
-            sleep_jitter()
+        log.info(f"  > Processing {len(candidates)} candidates...")
+        self.parse_all([(link,) for link in sorted(candidates)])
 
     def parse_detail(self, url):
-        print(f"  [IZUMIRAI] Processing: {url[:80]}")
+        log.debug("  [IZUMIRAI] Processing: %s", url[:80])
         inc_stat("scanned")
 
-        soup = self.fetch(url)
+        soup = self.fetch_detail(url)
         if not soup:
             return
 
-        h1 = soup.select_one("h1.detail-header__name")
+        h1 = soup.find("h1", class_="detail-header__name")
         title = clean_text(h1.get_text()) if h1 else ""
         if not title:
             title = "Izu Mirai Property"
@@ -1585,43 +1876,25 @@ class IzuMirai(BaseScraper):
 
         city = get_location_trust(soup, full_text)
         if city == "WRONG_CITY" or not city:
-            print(f"  [LOCATION FILTERED] IzuMirai - {city}: {url[:80]}")
+            log.debug("  [LOCATION FILTERED] IzuMirai - %s: %s", city, url[:80])
             inc_stat("skipped_loc")
             return
 
         # Sea view scoring (same tiers as other scrapers)
-        sea_score = 0
-        if "海は見えません" in full_text or "海眺望なし" in full_text or "海見えず" in full_text:
-            sea_score = 0
-        elif any(k in full_text for k in HIGH_SEA_KEYWORDS):
-            sea_score = 4
-        elif any(k in full_text for k in MEDIUM_SEA_KEYWORDS):
-            sea_score = 3
-        elif any(k in full_text for k in ["海", "ビーチ", "Beach"]):
-            proximity_patterns = [
-                r"海まで徒歩[0-9０-９]",
-                r"海まで.*[0-9０-９]+.*分",
-                r"海まで.*[0-9０-９]+.*[mｍメートル]",
-                r"海から[0-9０-９]+.*[mｍメートル]",
-                r"徒歩[0-9０-９]+.*分.*海",
-                r"ビーチまで.*[0-9０-９]+",
-                r"海.*徒歩圏",
-            ]
-            if any(re.search(p, full_text) for p in proximity_patterns):
-                sea_score = 2
+        sea_score = score_sea_view(full_text)
 
         if sea_score < 2:
-            print(f"  [SEA VIEW FILTERED] IzuMirai - score={sea_score}: {url[:60]}")
+            log.debug("  [SEA VIEW FILTERED] IzuMirai - score=%s: %s", sea_score, url[:60])
             inc_stat("skipped_loc")
             return
 
         price = extract_price(full_text)
         if not price or price <= 0:
-            print(f"  [PRICE FILTERED] No valid price: {url}")
+            log.debug("  [PRICE FILTERED] No valid price: %s", url)
             inc_stat("skipped_sold")
             return
 
-        og_img = soup.select_one('meta[property="og:image"]')
+        og_img = soup.find("meta", attrs={"property": "og:image"})
         img_url = og_img.get("content", "") if og_img else ""
 
         # Type: trust title keywords (site title always names the type explicitly)
@@ -1641,12 +1914,14 @@ class IzuMirai(BaseScraper):
 
         address = extract_address_str(soup)
 
+        city_en = CITY_EN_MAP.get(normalize_city(city) or city, city)
+
         item = {
             "id": item_id,
             "source": "Izu Mirai",
             "sourceUrl": url,
             "title": title,
-            "titleEn": f"{CITY_EN_MAP.get(city, city)} Property",
+            "titleEn": f"{city_en} Property",
             "propertyType": ptype,
             "city": city,
             "priceJpy": price,
@@ -1684,11 +1959,18 @@ def deduplicate(listings):
     """
     SOURCE_PRIORITY = {"Izu Taiyo": 0, "Maple Housing": 1, "Aoba Resort": 2, "Izu Mirai": 3, "SUUMO": 4}
 
+    # EQUIV_CITIES: pairs of cities whose boundary properties are routinely mis-tagged
+    # across sources (e.g. 下賀茂 straddles 南伊豆/下田 and SUUMO's sc_shimoda search
+    # context forces "下田" even when Izu Taiyo correctly assigns "南伊豆").
+    _EQUIV = frozenset({"下田", "南伊豆"})
+
     # Process preferred sources first so they "win" the fingerprint slot
     ranked = sorted(listings, key=lambda x: SOURCE_PRIORITY.get(x.get("source", ""), 99))
     seen       = {}  # (city, type, price_bucket, year) -> source  [primary]
     seen_xsrc  = {}  # (type, price_bucket, year)       -> source  [secondary, cross-source only]
+    seen_dated = {}  # (type, price_bucket) -> [(city, year, source)] for the near-year check
     out = []
+    dropped = []     # log lines, printed once after the loop
 
     for item in ranked:
         price = item.get("priceJpy", 0)
@@ -1706,58 +1988,61 @@ def deduplicate(listings):
         # Near-year check: same city+type+price (or equivalent adjacent city), year differs
         # by ≤1, different source.  Different data sources sometimes record construction vs.
         # completion year, causing a 1-year discrepancy for the same physical property.
-        # EQUIV_CITIES: pairs of cities whose boundary properties are routinely mis-tagged
-        # across sources (e.g. 下賀茂 straddles 南伊豆/下田 and SUUMO's sc_shimoda search
-        # context forces "下田" even when Izu Taiyo correctly assigns "南伊豆").
-        _EQUIV = frozenset({"下田", "南伊豆"})
+        # Only fingerprints with the same type and price bucket can match, so look
+        # those up directly instead of scanning every fingerprint seen so far.
         near_src = None
         if year != "?" and fp not in seen:
-            for (k_city, k_ptype, k_price, k_year), k_src in seen.items():
+            for k_city, k_year, k_src in seen_dated.get((ptype, price_bucket), ()):
                 cities_match = k_city == city or (
                     frozenset({k_city, city}) == _EQUIV
                 )
-                if (cities_match and k_ptype == ptype and k_price == price_bucket
-                        and k_year != "?" and abs(k_year - year) <= 1 and k_src != src):
+                if cities_match and abs(k_year - year) <= 1 and k_src != src:
                     near_src = k_src
                     break
 
         if fp in seen and seen[fp] != src:
             # Primary cross-source duplicate: same city+type+price+year, different site
-            print(f"  [DEDUP] Removed cross-source duplicate from {src}: {city} {ptype} ¥{man}万 built={year} (kept {seen[fp]})")
-            inc_stat("skipped_dup")
+            dropped.append(f"  [DEDUP] Removed cross-source duplicate from {src}: {city} {ptype} ¥{man}万 built={year} (kept {seen[fp]})")
         elif near_src:
             # Near-year cross-source duplicate: year differs by ≤1 (construction vs completion year),
             # same city or equivalent adjacent city
-            print(f"  [DEDUP] Removed near-year cross-source duplicate from {src}: {city} {ptype} ¥{man}万 built={year} (kept {near_src})")
-            inc_stat("skipped_dup")
+            dropped.append(f"  [DEDUP] Removed near-year cross-source duplicate from {src}: {city} {ptype} ¥{man}万 built={year} (kept {near_src})")
         elif fp_loose and fp_loose in seen_xsrc and seen_xsrc[fp_loose] != src:
             # Secondary cross-source duplicate: same type+price+year, different city label
             # (city detection mismatch between sites for the same physical property)
-            print(f"  [DEDUP] Removed cross-source duplicate (city mismatch) from {src}: {city} {ptype} ¥{man}万 built={year} (kept {seen_xsrc[fp_loose]})")
-            inc_stat("skipped_dup")
+            dropped.append(f"  [DEDUP] Removed cross-source duplicate (city mismatch) from {src}: {city} {ptype} ¥{man}万 built={year} (kept {seen_xsrc[fp_loose]})")
         else:
             # New fingerprint OR same source — keep it
             if fp not in seen:
                 seen[fp] = src
+                if year != "?":
+                    seen_dated.setdefault((ptype, price_bucket), []).append((city, year, src))
             if fp_loose and fp_loose not in seen_xsrc:
                 seen_xsrc[fp_loose] = src
             out.append(item)
 
+    if dropped:
+        log.info("\n".join(dropped))
+        inc_stat("skipped_dup", len(dropped))
     return out
 
 
 # --- MAIN ---
 
+_LOC_HEAD_RE = re.compile(r'^([^（「(]+)')
+_LOC_SUFFIX_RES = [re.compile(suffix + '.*$')
+                   for suffix in ['の家情報', 'の土地情報', 'のマンション情報']]
+
 def _extract_loc_str(title):
     """Mirror of JS extractLocStr — pulls geocodable address from a listing title."""
     if not title:
         return None
-    m = re.match(r'^([^（「(]+)', title)
+    m = _LOC_HEAD_RE.match(title)
     if not m:
         return None
     s = m.group(1).strip()
-    for suffix in ['の家情報', 'の土地情報', 'のマンション情報']:
-        s = re.sub(suffix + '.*$', '', s)
+    for suffix_re in _LOC_SUFFIX_RES:
+        s = suffix_re.sub('', s)
     s = s.strip()
     if not any(c in s for c in ['下田', '河津', '東伊豆', '南伊豆', '賀茂']):
         return None
@@ -1784,7 +2069,7 @@ def extract_address_str(soup):
         return ' '.join(parts) if parts else None
 
     for tag in soup.find_all(["th", "td", "dt", "dd"]):
-        tag_text = re.sub(r'\s+', '', tag.get_text())
+        tag_text = "".join(tag.get_text().split())
         if tag_text not in ADDR_MARKERS:
             continue
         sib = tag.find_next_sibling()
@@ -1806,6 +2091,9 @@ def extract_address_str(soup):
     return None
 
 
+_AZA_RE = re.compile(r'\s*字\S+')
+_HOUSE_NUMBER_RE = re.compile(r'[\s,、]+[0-9][0-9\-番地]*\s*$')
+
 def _geo_query_str(raw):
     """Prepare a raw address or title fragment for Nominatim.
 
@@ -1817,9 +2105,9 @@ def _geo_query_str(raw):
         return None
     s = raw
     # Remove 字XXX sub-area designators
-    s = re.sub(r'\s*字\S+', '', s)
+    s = _AZA_RE.sub('', s)
     # Remove trailing house/lot numbers (e.g. "1234-5", "1番地")
-    s = re.sub(r'[\s,、]+[0-9][0-9\-番地]*\s*$', '', s)
+    s = _HOUSE_NUMBER_RE.sub('', s)
     return s.strip() or None
 
 
@@ -1834,8 +2122,7 @@ def geocode_listings(listings):
     lookups fill in the gaps over successive daily scrapes.
     """
     try:
-        with open(GEOCACHE_FILE, encoding="utf-8") as f:
-            cache = json.load(f)
+        cache = load_json(GEOCACHE_FILE)
     except (FileNotFoundError, json.JSONDecodeError):
         cache = {}
 
@@ -1847,20 +2134,31 @@ def geocode_listings(listings):
     NOM_HEADERS = {"User-Agent": "IzuCoastalRadar/1.0"}
     new_lookups = 0
     geocoded = 0
+    # One keep-alive connection for every lookup instead of a fresh TLS
+    # handshake per requests.get()
+    nom = requests.Session()
+    nom.headers.update(NOM_HEADERS)
+    next_lookup_at = 0.0
 
     def _lookup(loc_str):
         """Query Nominatim; return [lat, lng] within Izu bounds or None."""
-        nonlocal new_lookups
+        nonlocal new_lookups, next_lookup_at
         q = _geo_query_str(loc_str)
         if not q:
             return None
         if q in cache:
             return cache[q]
+        # Nominatim rate limit: 1 req/sec, measured start to start so the
+        # request's own round trip counts towards the gap
+        wait = next_lookup_at - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        next_lookup_at = time.monotonic() + 1.1
         try:
-            r = requests.get(NOM_URL, params={
+            r = nom.get(NOM_URL, params={
                 "q": f"{q}, 静岡県, 日本",
                 "format": "json", "limit": 1, "accept-language": "ja"
-            }, headers=NOM_HEADERS, timeout=10, verify=False)
+            }, timeout=10, verify=False)
             data = r.json()
             coords = None
             if data:
@@ -1869,10 +2167,9 @@ def geocode_listings(listings):
                     coords = [lat, lng]
             cache[q] = coords
         except Exception as e:
-            print(f"  [GEO ERROR] {q}: {e}")
+            log.warning(f"  [GEO ERROR] {q}: {e}")
             cache[q] = None
         new_lookups += 1
-        time.sleep(1.1)  # Nominatim rate limit: 1 req/sec
         return cache[q]
 
     for item in listings:
@@ -1891,30 +2188,38 @@ def geocode_listings(listings):
             item["lat"], item["lng"] = coords[0], coords[1]
             geocoded += 1
 
-    with open(GEOCACHE_FILE, "w", encoding="utf-8") as f:
-        json.dump(cache, f, ensure_ascii=False, indent=2)
+    nom.close()
+    dump_json(cache, GEOCACHE_FILE)
 
-    print(f"  [GEO] {geocoded} geocoded ({new_lookups} new lookups, {len(cache)} cached)")
+    log.info(f"  [GEO] {geocoded} geocoded ({new_lookups} new lookups, {len(cache)} cached)")
     return geocoded
 
 
+def load_first_seen(path):
+    """Map id -> firstSeen from the previous run.
+
+    Only the small dict is returned; the parsed document is dropped here
+    instead of staying alive in main() for the whole scrape.
+    """
+    first_seen = {}
+    try:
+        old_data = load_json(path)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return first_seen  # No existing file or invalid JSON
+    for listing in old_data.get("listings", []):
+        if listing.get("id") and listing.get("firstSeen"):
+            first_seen[listing["id"]] = listing["firstSeen"]
+    return first_seen
+
+
 def main():
     # Fetch current forex rate
-    print("\n" + "="*50)
-    print(" FETCHING FOREX RATE")
-    print("="*50)
+    log.info("\n" + "="*50)
+    log.info(" FETCHING FOREX RATE")
+    log.info("="*50)
     forex_rate = get_usd_jpy_rate()
 
-    # Load existing listings to preserve firstSeen dates
-    existing_first_seen = {}
-    try:
-        with open(OUT_LISTINGS, "r", encoding="utf-8") as f:
-            old_data = json.load(f)
-            for listing in old_data.get("listings", []):
-                if listing.get("id") and listing.get("firstSeen"):
-                    existing_first_seen[listing["id"]] = listing["firstSeen"]
-    except (FileNotFoundError, json.JSONDecodeError):
-        pass  # No existing file or invalid JSON
+    existing_first_seen = load_first_seen(OUT_LISTINGS)
 
     SCRAPER_NAMES = ["Izu Taiyo", "Maple Housing", "Aoba Resort", "Izu Mirai", "SUUMO"]
     scrapers = [IzuTaiyo(), Maple(), Aoba(), IzuMirai(), Suumo()]
@@ -1922,10 +2227,19 @@ def main():
     scraper_diag = {}  # name -> {saved, fetchErrors, pagesOk}
 
     def run_scraper(s):
-        s.run()
+        # A bug or layout change on one site must not take the other sources
+        # down with it: log it and keep whatever was saved before the crash.
+        try:
+            s.run()
+        except Exception:
+            log.exception(f"  [ERROR] {type(s).__name__} scraper crashed")
+            with s.lock:
+                s.fetch_errors += 1
         return s
 
-    with ThreadPoolExecutor(max_workers=4) as executor:
+    # One thread per source: each scraper talks to its own host, so none of
+    # them has to wait for another to finish before starting.
+    with ThreadPoolExecutor(max_workers=len(scrapers)) as executor:
         for name, s in zip(SCRAPER_NAMES, executor.map(run_scraper, scrapers)):
             all_data.extend(s.items)
             inc_stat("saved", len(s.items))
@@ -1938,7 +2252,7 @@ def main():
     # Remove cross-source duplicates (same property on multiple sites)
     before_dedup = len(all_data)
     all_data = deduplicate(all_data)
-    print(f"\n  [DEDUP] {before_dedup} listings → {len(all_data)} after deduplication ({STATS['skipped_dup']} removed)")
+    log.info(f"\n  [DEDUP] {before_dedup} listings → {len(all_data)} after deduplication ({STATS['skipped_dup']} removed)")
 
     # Add firstSeen dates - preserve existing or set to today
     today = dt.datetime.now().strftime("%Y-%m-%d")
@@ -1950,62 +2264,62 @@ def main():
             item["firstSeen"] = today
             new_count += 1
 
-    print("\n" + "="*50)
-    print(" GEOCODING")
-    print("="*50)
+    log.info("\n" + "="*50)
+    log.info(" GEOCODING")
+    log.info("="*50)
     geocode_listings(all_data)
 
     out = {
         "generatedAt": dt.datetime.now().isoformat(),
         "listings": all_data
     }
-    with open(OUT_LISTINGS, "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
+    dump_json(out, OUT_LISTINGS)
 
-    counts = {}
-    for i in all_data:
-        counts[i['source']] = counts.get(i['source'], 0) + 1
+    counts = Counter(i["source"] for i in all_data)
 
     # Ensure every known scraper appears in counts (even if 0)
     for name in SCRAPER_NAMES:
         counts.setdefault(name, 0)
 
-    with open(OUT_BUILDINFO, "w", encoding="utf-8") as f:
-        json.dump({
-            "counts": counts,
-            "scraperDiagnostics": scraper_diag,
-            "generatedAt": out["generatedAt"],
-            "forexRate": forex_rate
-        }, f)
-
-    print("\n" + "="*50)
-    print(" SCAN SUMMARY")
-    print("="*50)
-    print(f" Total Scanned:        {STATS['scanned']}")
-    print(f" ✓ SAVED:              {len(all_data)}")
-    print(f"   (New listings:      {new_count})")
-    print(f" ✗ Skipped (Dupes):    {STATS['skipped_dup']}")
-    print(f" ✗ Skipped (Location): {STATS['skipped_loc']}")
-    print(f" ✗ Skipped (Sold):     {STATS['skipped_sold']}")
-    print(f" ✗ Skipped (Mansion):  {STATS['skipped_mansion']}")
-    print(f" ✗ Errors:             {STATS['error']}")
-    print("="*50)
-    print(" Breakdown by Source:")
+    dump_json({
+        "counts": counts,
+        "scraperDiagnostics": scraper_diag,
+        "generatedAt": out["generatedAt"],
+        "forexRate": forex_rate
+    }, OUT_BUILDINFO, indent=False)
+
+    log.info("\n" + "="*50)
+    log.info(" SCAN SUMMARY")
+    log.info("="*50)
+    log.info(f" Total Scanned:        {STATS['scanned']}")
+    log.info(f" ✓ SAVED:              {len(all_data)}")
+    log.info(f"   (New listings:      {new_count})")
+    log.info(f" ✗ Skipped (Dupes):    {STATS['skipped_dup']}")
+    log.info(f" ✗ Skipped (Location): {STATS['skipped_loc']}")
+    log.info(f" ✗ Skipped (Sold):     {STATS['skipped_sold']}")
+    log.info(f" ✗ Skipped (Mansion):  {STATS['skipped_mansion']}")
+    log.info(f" ✗ Errors:             {STATS['error']}")
+    log.info("="*50)
+    log.info(" Breakdown by Source:")
     for source, count in sorted(counts.items()):
-        print(f"   {source}: {count}")
-    print("="*50)
+        log.info(f"   {source}: {count}")
+    log.info("="*50)
 
     final_count = len(all_data)
     if final_count == 0:
-        print("\n⚠️  WARNING: No listings saved!")
-        print("   This may indicate:")
-        print("   - Website structure has changed")
-        print("   - Network connectivity issues")
-        print("   - Filters are too restrictive")
+        log.warning("\n⚠️  WARNING: No listings saved!")
+        log.warning("   This may indicate:")
+        log.warning("   - Website structure has changed")
+        log.warning("   - Network connectivity issues")
+        log.warning("   - Filters are too restrictive")
     elif final_count < 10:
-        print(f"\n⚠️  WARNING: Very few listings saved ({final_count})")
-        print("   Expected: 50+ listings")
-        print("   Check the website structure and filters")
+        log.warning(f"\n⚠️  WARNING: Very few listings saved ({final_count})")
+        log.warning("   Expected: 50+ listings")
+        log.warning("   Check the website structure and filters")
 
 if __name__ == "__main__":
+    # LOG_LEVEL applies to this script's logger only; the root logger stays at
+    # WARNING so DEBUG doesn't also switch on urllib3's per-connection lines
+    logging.basicConfig(format="%(message)s", stream=sys.stdout)
+    log.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
     main()